@@ -56,6 +56,7 @@ BuildRequires: python3-pytz
 BuildRequires: python3-requests
 BuildRequires: python3-resalloc
 BuildRequires: python3-retask
+BuildRequires: python3-rpm
 BuildRequires: python3-setproctitle
 BuildRequires: python3-sphinx
 BuildRequires: python3-tabulate
@@ -95,6 +96,7 @@ Requires:   python3-pytz
 Requires:   python3-requests
 Requires:   python3-resalloc >= 3.0
 Requires:   python3-retask
+Requires:   python3-rpm
 Requires:   python3-setproctitle
 Requires:   python3-tabulate
 Requires:   python3-boto3
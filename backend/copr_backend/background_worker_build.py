@@ -5,7 +5,6 @@ BuildBackgroundWorker class + internals.
 import glob
 import logging
 import os
-import pipes
 import shutil
 import statistics
 import time
@@ -641,14 +640,14 @@ class BuildBackgroundWorker(BackgroundWorker):
         self.log.info("Listing built binary packages in %s",
                       job.results_dir)
 
-        cmd = (
-            "builtin cd {0} && "
-            "for f in `ls *.rpm | grep -v \"src.rpm$\"`; do"
-            "   rpm -qp --qf \"%{{NAME}} %{{VERSION}}\n\" $f; "
-            "done".format(pipes.quote(job.results_dir))
-        )
+        rpms = sorted(
+            path for path in glob.glob(os.path.join(job.results_dir, "*.rpm"))
+            if not path.endswith((".src.rpm", ".nosrc.rpm")))
+        if not rpms:
+            return ""
 
-        result = run_cmd(cmd, shell=True)
+        cmd = ["rpm", "-qp", "--qf", "%{NAME} %{VERSION}\n"] + rpms
+        result = run_cmd(cmd)
         built_packages = result.stdout.strip()
         self.log.info("Built packages:\n%s", built_packages)
         return built_packages
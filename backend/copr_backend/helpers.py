@@ -25,6 +25,8 @@ import subprocess
 
 import pytz
 
+import rpm
+
 import munch
 from munch import Munch
 
@@ -662,24 +664,28 @@ def pkg_name_evr(srpm_path):
     """
     Queries a package for its name and evr (epoch:version-release)
     """
-    cmd = ['rpm', '-qp', '--nosignature', '--qf',
-           '%{NAME} %{EPOCH} %{VERSION} %{RELEASE}', srpm_path]
-
-    try:
-        result = run_cmd(cmd)
-    except OSError as e:
-        raise CoprBackendSrpmError(str(e))
-
-    if result.returncode != 0:
-        raise CoprBackendSrpmError('Error querying srpm: %s' % result.stderr)
+    ts = rpm.TransactionSet()
+    # The signing keys are not imported on backend, don't check signatures
+    # nor digests (the old 'rpm -qp --nosignature' behavior).
+    ts.setVSFlags(rpm._RPMVSF_NOSIGNATURES | rpm._RPMVSF_NODIGESTS)
 
     try:
-        name, epoch, version, release = result.stdout.split(" ")
-    except ValueError as e:
-        raise CoprBackendSrpmError(str(e))
-
-    # Epoch is an integer or '(none)' if not set
-    if epoch.isdigit():
+        with open(srpm_path, "rb") as srpm_fd:
+            header = ts.hdrFromFdno(srpm_fd.fileno())
+    except (OSError, rpm.error) as e:
+        raise CoprBackendSrpmError('Error querying srpm: %s' % str(e))
+
+    name = header[rpm.RPMTAG_NAME]
+    epoch = header[rpm.RPMTAG_EPOCH]
+    version = header[rpm.RPMTAG_VERSION]
+    release = header[rpm.RPMTAG_RELEASE]
+
+    if not (name and version and release):
+        raise CoprBackendSrpmError(
+            'Error querying srpm {}: incomplete NEVR'.format(srpm_path))
+
+    # Epoch is an integer, or None if not set
+    if epoch is not None:
         evr = "{}:{}-{}".format(epoch, version, release)
     else:
         evr = "{}-{}".format(version, release)
@@ -202,13 +202,15 @@ class SSHConnection(object):
         log_filepath = "/dev/null"
         if logfile:
             log_filepath = os.path.join(dest, logfile)
-        command = "/usr/bin/rsync -rltDvH --chmod=D755,F644 -e '{}' {} {}/ &> {}".format(
-            ssh_opts, full_source_path, dest, log_filepath)
+        command = ["/usr/bin/rsync", "-rltDvH", "--chmod=D755,F644",
+                   "-e", ssh_opts, full_source_path, dest + "/"]
 
         try:
             self.log.info("rsyncing of %s to %s started", full_source_path, dest)
-            cmd = subprocess.Popen(command, shell=True)
-            cmd.wait()
+            with open(log_filepath, "w") as rsync_log:
+                cmd = subprocess.Popen(command, stdout=rsync_log,
+                                       stderr=subprocess.STDOUT)
+                cmd.wait()
             self.log.info("rsyncing finished.")
         except Exception as error:
             self.log.error(
@@ -13,13 +13,14 @@ import pytest
 
 @pytest.yield_fixture
 def post_req():
-    with mock.patch("copr_common.request.post") as obj:
-        yield obj
+    with mock.patch("copr_common.request.requests") as obj:
+        yield obj.Session.return_value.post
 
 @pytest.fixture(scope='function', params=['get', 'post', 'put'])
 def f_request_method(request):
-    'mock the requests.{get,post,put} method'
-    with mock.patch("copr_common.request.{}".format(request.param)) as ctx:
+    'mock the requests.Session {get,post,put} method'
+    with mock.patch("copr_common.request.requests") as handle:
+        ctx = getattr(handle.Session.return_value, request.param)
         ctx.return_value.headers = {
             "Copr-FE-BE-API-Version": "666",
         }
@@ -11,10 +11,19 @@ class EnumType(type):
         if attr is None:
             raise NotImplementedError
         if isinstance(attr, int):
-            for k, v in cls.vals.items():
-                if v == attr:
-                    return k
-            raise KeyError("num {0} is not mapped".format(attr))
+            if "_rvals" not in cls.__dict__:
+                # Memoize the reverse mapping;  keep the first name when
+                # several of them share one value (as the original linear
+                # scan did).  Guard by cls.__dict__ to avoid recursing
+                # through __getattr__.
+                rvals = {}
+                for k, v in cls.vals.items():
+                    rvals.setdefault(v, k)
+                cls._rvals = rvals
+            try:
+                return cls._rvals[attr]
+            except KeyError:
+                raise KeyError("num {0} is not mapped".format(attr))
         return cls.vals[attr]
     def __call__(cls, attr):
         return cls._wrap(attr)
@@ -3,8 +3,11 @@ Common Copr code for dealing with HTTP requests
 """
 
 import json
+import os
 import time
-from requests import get, post, put, RequestException
+
+import requests
+from requests import RequestException
 
 
 class SafeRequest:
@@ -23,6 +26,21 @@ class SafeRequest:
         self.log = log
         self.try_indefinitely = try_indefinitely
         self.timeout = timeout
+        self._session = None
+        self._session_pid = None
+
+    @property
+    def session(self):
+        """
+        A requests.Session with connection pooling, so repeated requests
+        against the same server re-use one TCP (and TLS) connection.  The
+        daemons using this class fork worker processes and pooled sockets
+        can't be shared across processes, hence one session per PID.
+        """
+        if self._session_pid != os.getpid():
+            self._session = requests.Session()
+            self._session_pid = os.getpid()
+        return self._session
 
     def get(self, url, **kwargs):
         """
@@ -62,10 +80,7 @@ class SafeRequest:
             method = method.lower()
             if method in ['post', 'put']:
                 req_args['data'] = json.dumps(data)
-                method = post if method == 'post' else put
-            else:
-                method = get
-            response = method(url, **req_args)
+            response = getattr(self.session, method)(url, **req_args)
         except RequestException as ex:
             raise RequestRetryError(
                 "Requests error on {}: {}".format(url, str(ex)))
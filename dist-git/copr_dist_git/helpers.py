@@ -1,5 +1,6 @@
 import os
 import logging
+import shutil
 import subprocess
 import munch
 
@@ -105,6 +106,11 @@ class ConfigReader(object):
             cp, "dist-git", "sleep_time", 15, mode="int"
         )
 
+        # Upper bound for the exponential back-off of the idle task polling.
+        opts.sleep_time_max = _get_conf(
+            cp, "dist-git", "sleep_time_max", 120, mode="int"
+        )
+
         # Whether to use multi-threaded dist-git or not
         # It might be useful to set False for debugging
         # while ipdb does not support multiple threads.
@@ -168,8 +174,12 @@ def download_file(url, destination):
             filename = os.path.basename(url)
             filepath = os.path.join(destination, filename)
             with open(filepath, 'wb') as f:
-                for chunk in r.iter_content(1024):
-                    f.write(chunk)
+                # Copy the raw stream in large chunks; iterating over
+                # 1kB iter_content() chunks is needlessly CPU-hungry for
+                # SRPM-sized downloads.  Unlike iter_content(), the raw
+                # stream doesn't decode Content-Encoding by default.
+                r.raw.decode_content = True
+                shutil.copyfileobj(r.raw, f, length=1024 * 1024)
         except Exception as e:
             raise FileDownloadException(str(e))
     else:
@@ -3,6 +3,10 @@
 from .exceptions import PackageImportException
 
 class ImportTask(object):
+    # Task attributes copied verbatim from the frontend task dictionary.
+    REQUIRED_FIELDS = ("build_id", "owner", "project", "branches",
+                       "srpm_url", "pkg_name")
+
     def __init__(self):
         self.build_id = None
         self.owner = None
@@ -10,17 +14,13 @@ class ImportTask(object):
         self.branches = []
         self.srpm_url = None
 
-    @staticmethod
-    def from_dict(task_dict):
-        task = ImportTask()
+    @classmethod
+    def from_dict(cls, task_dict):
+        task = cls()
 
         try:
-            task.build_id = task_dict["build_id"]
-            task.owner = task_dict["owner"]
-            task.project = task_dict["project"]
-            task.branches = task_dict["branches"]
-            task.srpm_url = task_dict["srpm_url"]
-            task.pkg_name = task_dict["pkg_name"]
+            for field in cls.REQUIRED_FIELDS:
+                setattr(task, field, task_dict[field])
         except (KeyError, ValueError) as e:
             raise PackageImportException(str(e))
 
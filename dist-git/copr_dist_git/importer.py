@@ -3,9 +3,8 @@ import json
 import time
 import logging
 import tempfile
-import shutil
 
-from requests import get, post
+import requests
 
 from .package_import import import_package
 from .process_pool import Worker, Pool, SingleThreadWorker
@@ -26,7 +25,27 @@ class Importer(object):
         self.auth = ("user", self.opts.frontend_auth)
         self.headers = {"content-type": "application/json"}
 
-        self.tmp_root = None
+        # Keep per-task workdirs on tmpfs when available, so the srpm
+        # download and git/rpkg churn don't hit the physical disk.
+        self.tmp_root = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+
+        self._session = None
+        self._session_pid = None
+        self._idle_intervals = 0
+
+    @property
+    def session(self):
+        """
+        A per-process requests.Session with connection pooling, so the
+        frequent frontend polling and post-backs reuse one TCP (and TLS)
+        connection.  Import workers are forked processes, therefore we
+        can not share the parent's pooled sockets and create a fresh
+        session for each PID.
+        """
+        if self._session_pid != os.getpid():
+            self._session = requests.Session()
+            self._session_pid = os.getpid()
+        return self._session
 
     def try_to_obtain_new_tasks(self, exclude=None, limit=1):
         log.debug("Get task data...")
@@ -34,7 +53,7 @@ class Importer(object):
             exclude = []
         try:
             # get the data
-            r = get(self.get_url)
+            r = self.session.get(self.get_url)
             # take the first task
             builds = list(filter(lambda x: x["build_id"] not in exclude, r.json()))
             if not builds:
@@ -53,7 +72,8 @@ class Importer(object):
         Could raise error related to network connection.
         """
         log.debug("Sending back: \n{}".format(json.dumps(data_dict)))
-        return post(self.post_back_url, auth=self.auth, data=json.dumps(data_dict), headers=self.headers)
+        return self.session.post(self.post_back_url, auth=self.auth,
+                                 data=json.dumps(data_dict), headers=self.headers)
 
     def post_back_safe(self, data_dict):
         """
@@ -70,30 +90,29 @@ class Importer(object):
         :type task: ImportTask
         """
         per_task_log_handler = self.setup_per_task_logging(task)
-        workdir = tempfile.mkdtemp()
 
         result = { "build_id": task.build_id }
         try:
-            srpm_path = helpers.download_file(
-                task.srpm_url,
-                workdir
-            )
-
-            repo = os.path.join(self.opts.lookaside_location, task.reponame)
-            lockfile = os.path.join(repo, "import.lock")
-            with helpers.lock(lockfile):
-                result.update(import_package(
-                    self.opts,
-                    task.repo_namespace,
-                    task.branches,
-                    srpm_path,
-                    task.pkg_name,
-                ))
+            with tempfile.TemporaryDirectory(prefix="copr-import-",
+                                             dir=self.tmp_root) as workdir:
+                srpm_path = helpers.download_file(
+                    task.srpm_url,
+                    workdir
+                )
+
+                repo = os.path.join(self.opts.lookaside_location, task.reponame)
+                lockfile = os.path.join(repo, "import.lock")
+                with helpers.lock(lockfile):
+                    result.update(import_package(
+                        self.opts,
+                        task.repo_namespace,
+                        task.branches,
+                        srpm_path,
+                        task.pkg_name,
+                    ))
 
         except PackageImportException as e:
             log.exception("Exception raised during package import.")
-        finally:
-            shutil.rmtree(workdir)
 
         log.info("sending a response for task {}".format(result))
         self.post_back_safe(result)
@@ -129,9 +148,17 @@ class Importer(object):
                                                     limit=pool.workers - len(pool))
 
             if not mb_tasks:
-                time.sleep(self.opts.sleep_time)
+                # Exponentially back-off when there's nothing to do, so an
+                # idle importer doesn't hammer the frontend at a constant
+                # rate.  Reset as soon as a task arrives.
+                sleep = self.opts.sleep_time * 2 ** self._idle_intervals
+                if sleep < self.opts.sleep_time_max:
+                    # stop growing the exponent once the cap is reached
+                    self._idle_intervals += 1
+                time.sleep(min(sleep, self.opts.sleep_time_max))
                 continue
 
+            self._idle_intervals = 0
             for mb_task in mb_tasks:
                 p = worker_cls(target=self.do_import, args=[mb_task], id=mb_task.build_id, timeout=3600 * 3)
                 pool.append(p)
@@ -9,6 +9,8 @@ import tempfile
 import munch
 import multiprocessing
 
+from concurrent.futures import ThreadPoolExecutor
+
 # pyrpkg uses os.getlogin(). It requires tty which is unavailable when we run this script as a daemon
 # very dirty solution for now
 import pwd
@@ -119,17 +121,34 @@ def setup_git_repo(reponame, branches):
     if brand_new_package:
         refresh_cgit_listing(reponame)
 
-    for branch in branches:
-        try:
-            cmd = ["/usr/share/dist-git/mkbranch", branch, reponame]
-            subprocess.check_output(cmd, stderr=subprocess.STDOUT, encoding='utf-8')
-        except subprocess.CalledProcessError as e:
-            log.error("cmd: {}, rc: {}, msg: {}"
-                      .format(cmd, e.returncode, e.output.strip()))
-            if e.returncode == 128:
-                log.info("Branch already exists...continuing")
-            else:
-                raise PackageImportException(e.output)
+    # The mkbranch runs are independent (each only creates its own ref in
+    # the repo), and they spend most of the time waiting on the spawned
+    # script, so create the branches concurrently.
+    with ThreadPoolExecutor(max_workers=min(len(branches) or 1, 4)) as executor:
+        futures = [executor.submit(_make_branch, reponame, branch)
+                   for branch in branches]
+        for future in futures:
+            future.result()
+
+
+def _make_branch(reponame, branch):
+    """
+    Create one branch inside the repo, ignore already-existing branches.
+    """
+    try:
+        cmd = ["/usr/share/dist-git/mkbranch", branch, reponame]
+        subprocess.check_output(cmd, stderr=subprocess.STDOUT, encoding='utf-8')
+    except subprocess.CalledProcessError as e:
+        log.error("cmd: {}, rc: {}, msg: {}"
+                  .format(cmd, e.returncode, e.output.strip()))
+        # Git exits 128 for any fatal error, not just for an existing
+        # branch, and the concurrent mkbranch runs can now also hit
+        # transient ref/lock contention -- check the message before
+        # ignoring the failure.
+        if e.returncode == 128 and "already exists" in e.output:
+            log.info("Branch already exists...continuing")
+        else:
+            raise PackageImportException(e.output)
 
 
 def cleanup_repo(repo_path):
@@ -139,10 +158,8 @@ def cleanup_repo(repo_path):
 
     :param str repo_path: path to the repository
     """
-    to_remove = []
-    for f in os.listdir(repo_path):
-        if f not in ['.git', '.gitignore', 'sources']:
-            to_remove.append(f)
+    to_remove = [entry.name for entry in os.scandir(repo_path)
+                 if entry.name not in ('.git', '.gitignore', 'sources')]
     if to_remove:
         helpers.run_cmd(
             ['git', 'rm', '-r'] + to_remove)
@@ -164,7 +181,12 @@ def import_package(opts, namespace, branches, srpm_path, pkg_name):
     reponame = "{}/{}".format(namespace, pkg_name)
     setup_git_repo(reponame, branches)
 
-    repo_dir = tempfile.mkdtemp()
+    with tempfile.TemporaryDirectory(prefix="copr-repo-") as repo_dir:
+        return _import_package(opts, reponame, branches, srpm_path,
+                               pkg_name, repo_dir)
+
+
+def _import_package(opts, reponame, branches, srpm_path, pkg_name, repo_dir):
     log.debug("repo_dir: {}".format(repo_dir))
 
     # use rpkg lib to import the source rpm
@@ -243,7 +265,6 @@ def import_package(opts, namespace, branches, srpm_path, pkg_name):
         branch_commits[branch] = commands.commithash
 
     os.chdir(oldpath)
-    shutil.rmtree(repo_dir)
 
     return munch.Munch(
         branch_commits=branch_commits,
@@ -24,6 +24,7 @@ class Base(object):
 
             "cgit_pkg_list_location": self.tmp_dir_name,
             "sleep_time": 10,
+            "sleep_time_max": 120,
             "pool_busy_sleep_time": 0.5,
             "log_dir": self.tmp_dir_name,
             "per_task_log_dir": self.per_task_location,
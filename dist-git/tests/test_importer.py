@@ -42,14 +42,14 @@ def mc_time():
 
 @pytest.yield_fixture
 def mc_get():
-    with mock.patch("{}.get".format(MODULE_REF)) as handle:
-        yield handle
+    with mock.patch("{}.requests".format(MODULE_REF)) as handle:
+        yield handle.Session.return_value.get
 
 
 @pytest.yield_fixture
 def mc_post():
-    with mock.patch("{}.post".format(MODULE_REF)) as handle:
-        yield handle
+    with mock.patch("{}.requests".format(MODULE_REF)) as handle:
+        yield handle.Session.return_value.post
 
 
 class TestImporter(Base):
@@ -472,6 +472,37 @@ class BuildsLogic(object):
         return cls.create_new(user, copr, source_type, source_json, chroot_names,
                               pkgs=url, srpm_url=srpm_url, copr_dirname=copr_dirname, **build_options)
 
+    @classmethod
+    def create_new_from_urls(cls, user, copr, urls, chroot_names=None,
+                             copr_dirname=None, **build_options):
+        """
+        Batch variant of create_new_from_url() submitting one build per URL.
+        The session autoflush is suppressed for the whole set, so the pending
+        Build/BuildChroot rows are inserted by one flush on commit (batched
+        per table) instead of being flushed by the queries of every
+        subsequent create_new() call.
+
+        :type user: models.User
+        :type copr: models.Copr
+        :type urls: List[str]
+        :type chroot_names: List[str]
+        :rtype: List[models.Build]
+        """
+        if copr_dirname:
+            # Resolve (and flush) the directory once in advance, otherwise
+            # every per-url call below would try to re-create it with the
+            # autoflush disabled.
+            coprs_logic.CoprDirsLogic.get_or_create(copr, copr_dirname)
+            db.session.flush()
+
+        with db.session.no_autoflush:
+            return [
+                cls.create_new_from_url(
+                    user, copr, url, chroot_names=chroot_names,
+                    copr_dirname=copr_dirname, **build_options)
+                for url in urls
+            ]
+
     @classmethod
     def create_new_from_scm(cls, user, copr, scm_type, clone_url,
                             committish='', subdirectory='', spec='', srpm_build_method='rpkg',
@@ -186,12 +186,24 @@ class ComplexLogic(object):
 
     @staticmethod
     def get_build_safe(build_id):
-        try:
-            return BuildsLogic.get_by_id(build_id).one()
-        except (sqlalchemy.orm.exc.NoResultFound,
-                sqlalchemy.exc.DataError):
-            raise ObjectNotFound(
-                message="Build {} does not exist.".format(build_id))
+        """
+        Get models.Build by ID, memoized in flask.g for the lifetime of one
+        request.  The build views typically resolve the same build several
+        times per request (redirect helpers, permission checks, handler),
+        and each call used to be a separate SELECT.  No invalidation is
+        needed — the cache hands out the session-bound instance, so any
+        same-request mutation is visible through it.
+        """
+        cache = (flask.g.setdefault("_build_cache", {})
+                 if flask.has_app_context() else {})
+        if build_id not in cache:
+            try:
+                cache[build_id] = BuildsLogic.get_by_id(build_id).one()
+            except (sqlalchemy.orm.exc.NoResultFound,
+                    sqlalchemy.exc.DataError):
+                raise ObjectNotFound(
+                    message="Build {} does not exist.".format(build_id))
+        return cache[build_id]
 
     @staticmethod
     def get_build_chroot(build_id, chrootname):
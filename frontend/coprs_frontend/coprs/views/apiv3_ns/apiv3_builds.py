@@ -169,11 +169,10 @@ def create_from_url():
     def create_new_build(options):
         # create separate build for each package
         pkgs = form.pkgs.data.split("\n")
-        return [BuildsLogic.create_new_from_url(
-            flask.g.user, copr,
-            url=pkg,
+        return BuildsLogic.create_new_from_urls(
+            flask.g.user, copr, pkgs,
             **options,
-        ) for pkg in pkgs]
+        )
     return process_creating_new_build(copr, form, create_new_build)
 
 
@@ -31,6 +31,24 @@ from coprs.exceptions import (
 )
 
 
+# Enum values resolved once at import time instead of on every request.
+_UPLOAD_SOURCE_TYPE = helpers.BuildSourceEnum("upload")
+_REBUILD_STATUSES = (StatusEnum("failed"), StatusEnum("canceled"))
+
+
+def _active_chroots(copr):
+    """
+    Per-request cache for copr.active_chroots.  The property re-walks all
+    assigned copr_chroots (and their mock_chroots) on every access, and one
+    build-submission request may read it several times — in the form
+    factory, and again in the re-rendered form when validation fails.
+    """
+    cache = flask.g.setdefault("_active_chroots_cache", {})
+    if copr.id not in cache:
+        cache[copr.id] = copr.active_chroots
+    return cache[copr.id]
+
+
 @coprs_ns.route("/build/<int:build_id>/")
 def copr_build_redirect(build_id):
     build = ComplexLogic.get_build_safe(build_id)
@@ -89,8 +107,6 @@ def copr_builds(copr, page=1):
                               current_dirname=dirname,
                               copr_dirs=dirs,
                               flashes=flashes)))
-
-    flask.session.pop('_flashes', [])
     return response
 
 ################################ Url builds ################################
@@ -104,11 +120,20 @@ def copr_add_build(copr, form=None):
         copr, form, view='coprs_ns.copr_new_build')
 
 
-def render_add_build(copr, form, view):
+def _render_add_build(copr, form, view, form_factory, template, package=None):
+    """
+    Shared body of all the render_add_build_* helpers; they only differ in
+    the form factory and the template name.
+    """
     if not form:
-        form = forms.BuildFormUrlFactory(copr.active_chroots)()
-    return flask.render_template("coprs/detail/add_build/url.html",
-                                 copr=copr, view=view, form=form)
+        form = form_factory(_active_chroots(copr))()
+    return flask.render_template(template, copr=copr, form=form, view=view,
+                                 package=package)
+
+
+def render_add_build(copr, form, view):
+    return _render_add_build(copr, form, view, forms.BuildFormUrlFactory,
+                             "coprs/detail/add_build/url.html")
 
 
 @coprs_ns.route("/<username>/<coprname>/new_build/", methods=["POST"])
@@ -124,17 +149,18 @@ def copr_new_build(copr):
 
 def process_new_build_url(copr, add_view, url_on_success):
     def factory(**build_options):
-        pkgs = form.pkgs.data.split("\n")
-        for pkg in pkgs:
-            BuildsLogic.create_new_from_url(
-                flask.g.user, copr, pkg,
-                chroot_names=form.selected_chroots,
-                **build_options
-            )
+        # one normalization pass; StringListFilter already collapsed the
+        # whitespace, this just drops possible empty lines
+        pkgs = [url for url in form.pkgs.data.split("\n") if url.strip()]
+        BuildsLogic.create_new_from_urls(
+            flask.g.user, copr, pkgs,
+            chroot_names=form.selected_chroots,
+            **build_options
+        )
         for pkg in pkgs:
             flask.flash("New build has been created: {}".format(pkg), "success")
 
-    form = forms.BuildFormUrlFactory(copr.active_chroots)()
+    form = forms.BuildFormUrlFactory(_active_chroots(copr))()
     return process_new_build(copr, form, factory, render_add_build,
                              add_view, url_on_success, msg_on_success=False)
 
@@ -151,7 +177,11 @@ def process_new_build(copr, form, create_new_build_factory, add_function, add_vi
         }
 
         try:
-            create_new_build_factory(**build_options)
+            # Let the final commit flush all the pending rows at once;
+            # without this the queries issued while creating the builds
+            # autoflush them one by one.
+            with db.session.no_autoflush:
+                create_new_build_factory(**build_options)
             db.session.commit()
         except (ActionInProgressException, InsufficientRightsException, UnrepeatableBuildException, BadRequest) as e:
             db.session.rollback()
@@ -177,10 +207,8 @@ def copr_add_build_scm(copr, form=None):
 
 
 def render_add_build_scm(copr, form, view, package=None):
-    if not form:
-        form = forms.BuildFormScmFactory(copr.active_chroots)()
-    return flask.render_template("coprs/detail/add_build/scm.html",
-                                 copr=copr, form=form, view=view, package=package)
+    return _render_add_build(copr, form, view, forms.BuildFormScmFactory,
+                             "coprs/detail/add_build/scm.html", package)
 
 
 @coprs_ns.route("/<username>/<coprname>/new_build_scm/", methods=["POST"])
@@ -207,7 +235,7 @@ def process_new_build_scm(copr, add_view, url_on_success):
             form.selected_chroots,
             **build_options
         )
-    form = forms.BuildFormScmFactory(copr.active_chroots)()
+    form = forms.BuildFormScmFactory(_active_chroots(copr))()
     return process_new_build(copr, form, factory, render_add_build_scm, add_view, url_on_success)
 
 ################################ DistGit builds ################################
@@ -233,11 +261,9 @@ def copr_new_build_distgit(copr):
 
 def render_add_build_distgit(copr, form, view, package=None):
     """ Render the distgit build form """
-    if not form:
-        # pylint: disable=not-callable
-        form = forms.BuildFormDistGitSimpleFactory(copr.active_chroots)()
-    return flask.render_template("coprs/detail/add_build/distgit.html",
-                                 copr=copr, form=form, view=view, package=package)
+    return _render_add_build(copr, form, view,
+                             forms.BuildFormDistGitSimpleFactory,
+                             "coprs/detail/add_build/distgit.html", package)
 
 def process_new_build_distgit(copr, add_view, url_on_success):
     """ Handle the POST data from distgit build form """
@@ -253,7 +279,7 @@ def process_new_build_distgit(copr, add_view, url_on_success):
             **build_options
         )
     # pylint: disable=not-callable
-    form = forms.BuildFormDistGitSimpleFactory(copr.active_chroots)()
+    form = forms.BuildFormDistGitSimpleFactory(_active_chroots(copr))()
     return process_new_build(copr, form, factory, render_add_build_distgit, add_view, url_on_success)
 
 ################################ PyPI builds ################################
@@ -268,10 +294,8 @@ def copr_add_build_pypi(copr, form=None):
 
 
 def render_add_build_pypi(copr, form, view, package=None):
-    if not form:
-        form = forms.BuildFormPyPIFactory(copr.active_chroots)()
-    return flask.render_template("coprs/detail/add_build/pypi.html",
-                                 copr=copr, form=form, view=view, package=package)
+    return _render_add_build(copr, form, view, forms.BuildFormPyPIFactory,
+                             "coprs/detail/add_build/pypi.html", package)
 
 
 @coprs_ns.route("/<username>/<coprname>/new_build_pypi/", methods=["POST"])
@@ -297,7 +321,7 @@ def process_new_build_pypi(copr, add_view, url_on_success):
             form.selected_chroots,
             **build_options
         )
-    form = forms.BuildFormPyPIFactory(copr.active_chroots)()
+    form = forms.BuildFormPyPIFactory(_active_chroots(copr))()
     return process_new_build(copr, form, factory, render_add_build_pypi, add_view, url_on_success)
 
 
@@ -313,10 +337,8 @@ def copr_add_build_rubygems(copr, form=None):
 
 
 def render_add_build_rubygems(copr, form, view, package=None):
-    if not form:
-        form = forms.BuildFormRubyGemsFactory(copr.active_chroots)()
-    return flask.render_template("coprs/detail/add_build/rubygems.html",
-                                 copr=copr, form=form, view=view, package=package)
+    return _render_add_build(copr, form, view, forms.BuildFormRubyGemsFactory,
+                             "coprs/detail/add_build/rubygems.html", package)
 
 
 @coprs_ns.route("/<username>/<coprname>/new_build_rubygems/", methods=["POST"])
@@ -338,7 +360,7 @@ def process_new_build_rubygems(copr, add_view, url_on_success):
             form.selected_chroots,
             **build_options
         )
-    form = forms.BuildFormRubyGemsFactory(copr.active_chroots)()
+    form = forms.BuildFormRubyGemsFactory(_active_chroots(copr))()
     return process_new_build(copr, form, factory, render_add_build_rubygems, add_view, url_on_success)
 
 ############################### Custom builds ###############################
@@ -366,7 +388,7 @@ def copr_new_build_custom(copr):
             **build_options
         )
 
-    form = forms.BuildFormCustomFactory(copr.active_chroots)()
+    form = forms.BuildFormCustomFactory(_active_chroots(copr))()
 
     return process_new_build(copr, form, factory, render_add_build_custom,
                              view, url_on_success)
@@ -382,10 +404,8 @@ def copr_add_build_custom(copr, form=None):
                                    'coprs_ns.copr_new_build_custom')
 
 def render_add_build_custom(copr, form, view, package=None):
-    if not form:
-        form = forms.BuildFormCustomFactory(copr.active_chroots)()
-    return flask.render_template("coprs/detail/add_build/custom.html",
-                                 copr=copr, form=form, view=view)
+    return _render_add_build(copr, form, view, forms.BuildFormCustomFactory,
+                             "coprs/detail/add_build/custom.html", package)
 
 
 ################################ Upload builds ################################
@@ -400,10 +420,8 @@ def copr_add_build_upload(copr, form=None):
 
 
 def render_add_build_upload(copr, form, view):
-    if not form:
-        form = forms.BuildFormUploadFactory(copr.active_chroots)()
-    return flask.render_template("coprs/detail/add_build/upload.html",
-                                 copr=copr, form=form, view=view)
+    return _render_add_build(copr, form, view, forms.BuildFormUploadFactory,
+                             "coprs/detail/add_build/upload.html")
 
 
 @coprs_ns.route("/<username>/<coprname>/new_build_upload/", methods=["POST"])
@@ -425,7 +443,7 @@ def process_new_build_upload(copr, add_view, url_on_success):
             chroot_names=form.selected_chroots,
             **build_options
         )
-    form = forms.BuildFormUploadFactory(copr.active_chroots)()
+    form = forms.BuildFormUploadFactory(_active_chroots(copr))()
     return process_new_build(copr, form, factory, render_add_build_upload, add_view, url_on_success)
 
 
@@ -450,7 +468,7 @@ def process_rebuild(copr, build_id, view, url_on_success):
             **build_options
         )
     # pylint: disable=not-callable
-    form = forms.BuildFormRebuildFactory.create_form_cls(copr.active_chroots)()
+    form = forms.BuildFormRebuildFactory.create_form_cls(_active_chroots(copr))()
     return process_new_build(copr, form, factory, render_add_build, view, url_on_success)
 
 
@@ -469,7 +487,7 @@ def process_copr_repeat_build(build_id, copr):
     if not flask.g.user.can_build_in(build.copr):
         flask.flash("You are not allowed to repeat this build.")
 
-    if build.source_type == helpers.BuildSourceEnum('upload'):
+    if build.source_type == _UPLOAD_SOURCE_TYPE:
         # If the original build's source is 'upload', we don't have the original
         # uploaded file anymore.  Therefore we skip the import now and re-use
         # existing imported sources (work-around).  This though means that we
@@ -480,7 +498,7 @@ def process_copr_repeat_build(build_id, copr):
     else:
         # For all other sources, we will show all chroots enabled in the project
         # and proceed with import.
-        available_chroots = copr.active_chroots
+        available_chroots = _active_chroots(copr)
 
     # pylint: disable=not-callable
     form = forms.BuildFormRebuildFactory.create_form_cls(available_chroots)(
@@ -492,13 +510,17 @@ def process_copr_repeat_build(build_id, copr):
     app.logger.debug("got param chroot: {}".format(chroot_to_build))
     if chroot_to_build:
         # set single checkbox if chroot query arg was provided
-        if chroot_to_build in [ch.name for ch in available_chroots]:
+        if any(ch.name == chroot_to_build for ch in available_chroots):
             form.chroots.data.append(chroot_to_build)
     else:
-        build_chroot_names = set(ch.name for ch in build.chroots)
-        build_failed_chroot_names = set(ch.name for ch in build.get_chroots_by_status([
-            StatusEnum('failed'), StatusEnum('canceled'),
-        ]))
+        # collect both the built and the failed/canceled chroot names in
+        # one pass over the old build's chroots
+        build_chroot_names = set()
+        build_failed_chroot_names = set()
+        for build_chroot in build.build_chroots:
+            build_chroot_names.add(build_chroot.name)
+            if build_chroot.status in _REBUILD_STATUSES:
+                build_failed_chroot_names.add(build_chroot.name)
         for ch in available_chroots:
             # check checkbox on all the chroots that have not been (successfully) built before
             if (ch.name not in build_chroot_names) or (ch.name in build_failed_chroot_names):
@@ -1126,7 +1126,11 @@ def copr_forks(copr):
 
 @coprs_ns.route("/update_search_index/", methods=["POST"])
 def copr_update_search_index():
-    subprocess.call(['/usr/share/copr/coprs_frontend/manage.py', 'update-indexes-quick', '1'])
+    returncode = subprocess.call(
+        ['/usr/share/copr/coprs_frontend/manage.py', 'update-indexes-quick', '1'])
+    if returncode != 0:
+        app.logger.error("update-indexes-quick exited with %s", returncode)
+        return "ERROR", 500
     return "OK"
 
 
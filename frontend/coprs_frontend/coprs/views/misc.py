@@ -310,6 +310,11 @@ def send_build_icon(build, no_cache=False):
     if no_cache:
         response.headers['Cache-Control'] = 'no-cache'
         response.headers['Pragma'] = 'no-cache'
+    else:
+        # For a concrete build the state is final at this point, so let
+        # clients (and GitHub's image proxy) cache the icon instead of
+        # re-polling us.
+        response.headers['Cache-Control'] = 'public, max-age=3600'
     return response
 
 
@@ -2,7 +2,7 @@ import os
 import whoosh
 import time
 
-from subprocess import Popen, PIPE
+from subprocess import Popen, PIPE, DEVNULL
 from flask_whooshee import AbstractWhoosheer
 
 from coprs import app
@@ -128,8 +128,8 @@ class WhoosheeStamp(object):
     def current(cls):
         packages = ["python3-flask-whooshee", "python3-whoosh"]
         cmd = ["rpm", "-q", "--qf", "%{NAME}-%{VERSION}\n"] + packages
-        process = Popen(cmd, stdout=PIPE, stderr=PIPE)
-        out, err = process.communicate()
+        process = Popen(cmd, stdout=PIPE, stderr=DEVNULL)
+        out, _ = process.communicate()
         return out.decode("utf-8").rstrip()
 
     @classmethod
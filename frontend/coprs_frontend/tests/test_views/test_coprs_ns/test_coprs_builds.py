@@ -31,6 +31,31 @@ class TestCoprAddBuild(CoprsTestCase):
 
         assert self.models.Build.query.first().pkgs == "http://example.com/testing.src.rpm"
 
+    @TransactionDecorator("u1")
+    def test_copr_user_can_add_multiple_builds(self, f_users, f_coprs,
+                                               f_mock_chroots, f_db):
+
+        self.db.session.add_all([self.u1, self.c1])
+        urls = [
+            "http://example.com/one.src.rpm",
+            "http://example.com/two.src.rpm",
+            "http://example.com/three.src.rpm",
+        ]
+        # the blank line must get filtered out
+        pkgs = "{0}\n\n{1}\n{2}".format(*urls)
+        self.test_client.post("/coprs/{0}/{1}/new_build/"
+                              .format(self.u1.name, self.c1.name),
+                              data={"pkgs": pkgs, "source_type": "link",
+                                    "chroots": "fedora-18-x86_64"},
+                              follow_redirects=True)
+
+        builds = self.models.Build.query.order_by(self.models.Build.id).all()
+        assert [b.pkgs for b in builds] == urls
+        expected_chroots = {ch.name for ch in builds[0].copr.active_chroots}
+        assert expected_chroots
+        for build in builds:
+            assert {ch.name for ch in build.chroots} == expected_chroots
+
     @TransactionDecorator("u1")
     def test_copr_allowed_user_can_add_build(self, f_users, f_coprs,
                                              f_mock_chroots,
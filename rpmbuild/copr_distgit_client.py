@@ -31,9 +31,10 @@ def log_cmd(command, comment="Running command"):
 def check_output(cmd, comment="Reading stdout from command"):
     """ el6 compatible subprocess.check_output() """
     log_cmd(cmd, comment)
-    process = subprocess.Popen(
-        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    (stdout, _) = process.communicate()
+    with open(os.devnull, "wb") as devnull:
+        process = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=devnull)
+        (stdout, _) = process.communicate()
     if process.returncode:
         raise RuntimeError("Exit non-zero: {0}".format(process.returncode))
     return stdout
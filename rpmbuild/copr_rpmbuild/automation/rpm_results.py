@@ -35,13 +35,9 @@ class RPMResults(AutomationTool):
         Find all RPM packages in the `resultdir` and return their NEVRAs
         as `dicts`
         """
-        nevras = []
-        for result in os.listdir(self.resultdir):
-            if not result.endswith(".rpm"):
-                continue
-            package = os.path.join(self.resultdir, result)
-            nevras.append(self.get_nevra_dict(package))
-        return nevras
+        return [self.get_nevra_dict(entry.path)
+                for entry in os.scandir(self.resultdir)
+                if entry.name.endswith(".rpm")]
 
     @classmethod
     def get_nevra_dict(cls, path):
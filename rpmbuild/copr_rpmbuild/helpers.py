@@ -1,8 +1,10 @@
 import errno
+import hashlib
 import logging
 import subprocess
 import glob
 import os
+import shutil
 import sys
 import re
 import configparser
@@ -158,6 +160,16 @@ def read_config(config_path=None):
         "pidfile": "/var/lib/copr-rpmbuild/pid",
         "logger_pidfile": "/var/lib/copr-rpmbuild/logger_pid",
         "enabled_source_protocols": "https ftps",
+        # Keep a persistent cache of cloned repositories there, empty
+        # value disables the caching.
+        "git_cache_dir": "",
+        # How many repository mirrors to keep in git_cache_dir before the
+        # least recently used ones are evicted.
+        "git_cache_max_mirrors": "64",
+        # When the frontend's tmp storage is reachable as a local path
+        # (frontend on the same host, or a shared volume), the custom-build
+        # hook payloads are copied from there instead of downloaded.
+        "frontend_local_payload_dir": "",
         "rpm_vendor_copr_name": "Unknown Copr",
     })
     config_paths = [os.path.join(path, "main.ini") for path in CONF_DIRS]
@@ -268,16 +280,109 @@ def git_clone_url_basepath(clone_url):
         return last_part[:-4]
     return last_part
 
-def git_clone_and_checkout(url, committish, repo_path, scm_type="git"):
+# How many repository mirrors we keep in the git cache directory before
+# we start to evict the least recently used ones.  Just the default,
+# overridable by the git_cache_max_mirrors config option.  Note this is
+# an entry-count cap, not a size cap;  size the option for the expected
+# repository count.
+GIT_CACHE_MAX_MIRRORS = 64
+
+
+def _git_cache_evict(cache_dir, keep):
+    """
+    Keep at most KEEP least-recently-used mirrors below CACHE_DIR, drop
+    the rest.  The mirror directory mtime is bumped on every cache hit,
+    so it works as the LRU timestamp.
+    """
+    mirrors = sorted(glob.glob(os.path.join(cache_dir, "*")),
+                     key=os.path.getmtime)
+    for mirror in mirrors[:max(0, len(mirrors) - keep)]:
+        log.info("Evicting old git cache entry {0}".format(mirror))
+        shutil.rmtree(mirror, ignore_errors=True)
+
+
+def update_git_cache(url, cache_dir, max_mirrors=None):
+    """
+    Maintain a persistent bare mirror of URL below CACHE_DIR so that
+    repeated builds from the same repository only pay for an incremental
+    'git fetch' instead of a full re-clone.  At most MAX_MIRRORS mirrors
+    are kept (GIT_CACHE_MAX_MIRRORS by default).
+
+    :returns str: path to the up-to-date mirror, or None when the cache
+        can not be updated (callers fall back to a plain clone then).
+    """
+    max_mirrors = max_mirrors or GIT_CACHE_MAX_MIRRORS
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    mirror = os.path.join(cache_dir, digest)
+    try:
+        if os.path.isdir(os.path.join(mirror, "objects")):
+            run_cmd(["git", "-C", mirror, "remote", "update", "--prune"])
+        else:
+            try:
+                os.makedirs(cache_dir)
+            except OSError as e:
+                if e.errno != errno.EEXIST:
+                    raise
+            _git_cache_evict(cache_dir, max_mirrors - 1)
+            run_cmd(["git", "clone", "--mirror", url, mirror])
+        # bump the LRU timestamp for _git_cache_evict()
+        os.utime(mirror, None)
+    except (RuntimeError, OSError) as e:
+        log.error("Can not update the git cache for {0}: {1}".format(url, e))
+        return None
+    return mirror
+
+
+def git_clone_and_checkout(url, committish, repo_path, scm_type="git",
+                           cache_dir=None, cache_max_mirrors=None):
     """
     Clone given URL (SCM_TYPE=svn/git) into REPO_PATH, and checkout the
-    COMMITTISH reference.
+    COMMITTISH reference.  When CACHE_DIR is set (git only), the objects
+    are downloaded into a persistent local mirror first and the clone is
+    done from that mirror so we don't re-download them next time.
     """
+    if scm_type == "git" and cache_dir:
+        mirror = update_git_cache(url, cache_dir, cache_max_mirrors)
+        if mirror:
+            try:
+                # Drop bookkeeping of checkouts removed by previous builds.
+                run_cmd(['git', '-C', mirror, 'worktree', 'prune'])
+                # A worktree shares the object store with the mirror;  that's
+                # both faster and much smaller than creating a fresh clone.
+                # The mirror contains all the remote refs, so even e.g.
+                # 'refs/pull/N/head' committishes resolve directly.
+                run_cmd(['git', '-C', mirror, 'worktree', 'add', '--detach',
+                         repo_path, committish or 'HEAD'])
+                # 'worktree add' doesn't touch submodules, while the plain
+                # clone below is --recursive;  keep both paths equivalent.
+                run_cmd(['git', '-C', repo_path, 'submodule', 'update',
+                         '--init', '--recursive'])
+                return
+            except RuntimeError as e:
+                # Fall back to the direct clone below.  The worktree may
+                # already be checked out (e.g. only the submodule step
+                # failed), and 'git clone' requires an empty destination.
+                log.error(str(e))
+                shutil.rmtree(repo_path, ignore_errors=True)
+                try:
+                    run_cmd(['git', '-C', mirror, 'worktree', 'prune'])
+                except RuntimeError as prune_error:
+                    log.error(str(prune_error))
     if scm_type == 'git':
-        clone_cmd = ['git', 'clone', url,
-                     repo_path, '--depth', '500',
-                     '--no-single-branch',
-                     "--recursive"]
+        if committish:
+            # The COMMITTISH gets checked out below, skip the implicit
+            # checkout of the default branch.
+            clone_cmd = ['git', 'clone', url,
+                         repo_path, '--depth', '500',
+                         '--no-single-branch', '--no-checkout',
+                         "--recursive"]
+        else:
+            # We build from the tip of the default branch, so there's no
+            # need to download the history, the other branches, or the tags.
+            clone_cmd = ['git', 'clone', url,
+                         repo_path, '--depth', '1',
+                         '--single-branch', '--no-tags',
+                         "--recursive"]
     else:
         clone_cmd = ['git', 'svn', 'clone', url,
                      repo_path]
@@ -288,22 +393,31 @@ def git_clone_and_checkout(url, committish, repo_path, scm_type="git"):
         log.error(str(e))
         if scm_type == 'git':
             # re-try with deep-full clone
-            run_cmd(['git', 'clone', url, repo_path])
+            retry_cmd = ['git', 'clone', url, repo_path]
+            if committish:
+                retry_cmd += ['--no-checkout']
+            run_cmd(retry_cmd)
         else:
             raise e
 
     if committish:
         # Do the checkout only if explicitly requested, otherwise build against
         # the default branch.
+        _git_checkout(committish, repo_path)
 
-        # First, fetch a remote reference if used.
-        # This is a guesstimate for GitHub, GitLab and Pagure.
-        if committish.startswith("refs/"):
-            fetch_cmd = ['git', 'fetch', 'origin', '{0}:{0}'.format(committish)]
-            run_cmd(fetch_cmd, cwd=repo_path)
 
-        checkout_cmd = ['git', 'checkout', committish]
-        run_cmd(checkout_cmd, cwd=repo_path)
+def _git_checkout(committish, repo_path):
+    """
+    Checkout the COMMITTISH reference within an already cloned REPO_PATH.
+    """
+    # First, fetch a remote reference if used.
+    # This is a guesstimate for GitHub, GitLab and Pagure.
+    if committish.startswith("refs/"):
+        fetch_cmd = ['git', 'fetch', 'origin', '{0}:{0}'.format(committish)]
+        run_cmd(fetch_cmd, cwd=repo_path)
+
+    checkout_cmd = ['git', 'checkout', committish]
+    run_cmd(checkout_cmd, cwd=repo_path)
 
 
 def macros_for_task(task, config):
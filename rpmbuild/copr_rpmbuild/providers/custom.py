@@ -1,6 +1,7 @@
 import os
 import logging
 import shutil
+import subprocess
 
 from copr_rpmbuild import helpers
 from .base import Provider
@@ -16,6 +17,7 @@ class CustomProvider(Provider):
     inner_resultdir = None
     inner_workdir = '/workdir'
     hook_payload_url = None
+    hook_payload_tmp = None
 
     workdir = None
 
@@ -27,6 +29,7 @@ class CustomProvider(Provider):
         self.timeout = source_json.get("timeout", 3600)
 
         if 'hook_data' in source_json:
+            self.hook_payload_tmp = source_json['tmp']
             self.hook_payload_url = "{server}/tmp/{tmp}/hook_payload".format(
                 server=self.config.get("main", "frontend_url"),
                 tmp=source_json['tmp'],
@@ -50,6 +53,28 @@ class CustomProvider(Provider):
                          .format(key, value))
         return template
 
+    def _copy_local_hook_payload(self, dest):
+        """
+        Fast path for the hook payload.  When the frontend's tmp storage is
+        reachable as a local path (frontend_local_payload_dir option), copy
+        the file from disk and skip the HTTP round-trip entirely.  Returns
+        True on success, False means "go and download it".
+        """
+        payload_dir = self.config.get("main", "frontend_local_payload_dir",
+                                      fallback=None)
+        if not payload_dir:
+            return False
+
+        source = os.path.join(payload_dir, self.hook_payload_tmp,
+                              'hook_payload')
+        try:
+            shutil.copyfile(source, dest)
+            return True
+        except OSError as err:
+            log.warning("Can't copy local hook payload %s (%s), falling "
+                        "back to %s", source, err, self.hook_payload_url)
+            return False
+
     def produce_srpm(self):
         mock_config_file = self.generate_mock_config("mock-config.cfg")
         cmd = [
@@ -63,14 +88,20 @@ class CustomProvider(Provider):
             cmd += ['--builddeps', self.builddeps]
 
         if self.hook_payload_url:
-            chunk_size = 1024
             hook_payload_file = os.path.join(self.resultdir, 'hook_payload')
-            response = self.request.get(self.hook_payload_url, stream=True)
-            response.raise_for_status()
-
-            with open(hook_payload_file, 'wb') as payload_file:
-                for chunk in response.iter_content(chunk_size):
-                    payload_file.write(chunk)
+            if not self._copy_local_hook_payload(hook_payload_file):
+                response = self.request.get(self.hook_payload_url, stream=True)
+                response.raise_for_status()
+
+                with open(hook_payload_file, 'wb') as payload_file:
+                    # copy the payload in C-level code (and with a much
+                    # larger buffer) instead of looping over 1kB
+                    # iter_content() chunks; decode_content makes the
+                    # raw stream undo any Content-Encoding the same way
+                    # iter_content() would
+                    response.raw.decode_content = True
+                    shutil.copyfileobj(response.raw, payload_file,
+                                       length=1024 * 1024)
 
             cmd += ['--hook-payload-file', hook_payload_file]
 
@@ -99,6 +130,22 @@ class CustomProvider(Provider):
         srpm_srcdir = os.path.join(self.workdir, 'srcdir')
 
         helpers.run_cmd(mock + ['--copyout', inner_resultdir, srpm_srcdir])
-        helpers.run_cmd(mock + ['--scrub', 'all'])
-        helpers.build_srpm(srpm_srcdir, self.resultdir)
-        shutil.rmtree(srpm_srcdir)
+
+        # The chroot scrub only tears mock's buildroot down and is
+        # independent of the SRPM build from the already copied-out
+        # sources, so let it run in background overlapped with rpmbuild.
+        scrub_cmd = mock + ['--scrub', 'all']
+        log.info('Running (in background): %s', ' '.join(scrub_cmd))
+        scrub = subprocess.Popen(scrub_cmd, stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL)
+        try:
+            helpers.build_srpm(srpm_srcdir, self.resultdir)
+        finally:
+            scrub.wait()
+
+        if scrub.returncode != 0:
+            raise RuntimeError("Command '{0}' failed with {1}".format(
+                ' '.join(scrub_cmd), scrub.returncode))
+
+        # no explicit srpm_srcdir removal; it lives inside self.workdir
+        # which Provider.cleanup() drops right after we return
@@ -15,6 +15,8 @@ class DistGitProvider(Provider):
     clone_url = None
     committish = None
     clone_to = None
+    git_cache_dir = None
+    git_cache_max_mirrors = None
 
     def init_provider(self):
         self.clone_url = self.source_dict["clone_url"]
@@ -22,6 +24,11 @@ class DistGitProvider(Provider):
         self.clone_to = os.path.join(
             self.workdir,
             helpers.git_clone_url_basepath(self.clone_url))
+        self.git_cache_dir = self.config.get(
+            "main", "git_cache_dir", fallback=None) or None
+        self.git_cache_max_mirrors = self.config.getint(
+            "main", "git_cache_max_mirrors",
+            fallback=helpers.GIT_CACHE_MAX_MIRRORS)
 
     def produce_sources(self):
         """
@@ -32,7 +39,9 @@ class DistGitProvider(Provider):
         second for getting sources from our own "proxy" DistGit instance.
         """
         helpers.git_clone_and_checkout(self.clone_url, self.committish,
-                                       self.clone_to)
+                                       self.clone_to,
+                                       cache_dir=self.git_cache_dir,
+                                       cache_max_mirrors=self.git_cache_max_mirrors)
         helpers.run_cmd(["copr-distgit-client", "sources"], cwd=self.clone_to)
 
     def produce_srpm(self):
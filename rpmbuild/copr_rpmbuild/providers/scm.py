@@ -41,6 +41,12 @@ class ScmProvider(Provider):
         # make_srpm method can create root-owned files in resultdir
         self.use_safe_resultdir = self.srpm_build_method == "make_srpm"
 
+        self.git_cache_dir = self.config.get(
+            "main", "git_cache_dir", fallback=None) or None
+        self.git_cache_max_mirrors = self.config.getint(
+            "main", "git_cache_max_mirrors",
+            fallback=helpers.GIT_CACHE_MAX_MIRRORS)
+
     def generate_rpkg_config(self):
         parsed_clone_url = urlparse(self.clone_url)
         distgit_config_section = None
@@ -83,9 +89,8 @@ class ScmProvider(Provider):
         config_path = os.path.join(config_dir_path, 'rpkg.conf')
         log.debug('Writing config into '+config_path)
 
-        f = open(config_path, "w+")
-        f.write(config)
-        f.close()
+        with open(config_path, "w") as f:
+            f.write(config)
 
         return config_path
 
@@ -130,7 +135,9 @@ class ScmProvider(Provider):
             self.clone_url,
             self.committish,
             self.repo_path,
-            self.scm_type)
+            self.scm_type,
+            cache_dir=self.git_cache_dir,
+            cache_max_mirrors=self.git_cache_max_mirrors)
         cmd = {
             'rpkg': self.get_rpkg_command,
             'tito': self.get_tito_command,
@@ -136,9 +136,14 @@ mv refs/heads/pr refs/pull/50/head
 def test_with_without_committish(run_cmd, committish):
     git_clone_and_checkout("clone_url", committish, "/dir")
     expected = []
-    expected += [mock.call(['git', 'clone', 'clone_url', '/dir', '--depth',
-                            '500', '--no-single-branch', '--recursive'])]
     if committish:
+        expected += [mock.call(['git', 'clone', 'clone_url', '/dir', '--depth',
+                                '500', '--no-single-branch', '--no-checkout',
+                                '--recursive'])]
         expected += [mock.call(['git', 'checkout', committish], cwd='/dir')]
+    else:
+        expected += [mock.call(['git', 'clone', 'clone_url', '/dir', '--depth',
+                                '1', '--single-branch', '--no-tags',
+                                '--recursive'])]
 
     assert expected == run_cmd.call_args_list
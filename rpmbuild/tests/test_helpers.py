@@ -1,9 +1,15 @@
+import hashlib
 import unittest
 import tempfile
 import shutil
 import os
 
-from copr_rpmbuild.helpers import string2list, locate_srpm
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from copr_rpmbuild.helpers import string2list, locate_srpm, update_git_cache
 
 class TestHelpers(unittest.TestCase):
     def test_string2list(self):
@@ -19,3 +25,25 @@ class TestHelpers(unittest.TestCase):
         open(srpm_path, "w").close()
         self.assertEqual(srpm_path, locate_srpm(tmpdir))
         shutil.rmtree(tmpdir)
+
+    @mock.patch("copr_rpmbuild.helpers.run_cmd")
+    def test_update_git_cache(self, run_cmd):
+        tmpdir = tempfile.mkdtemp(prefix="copr-rpmbuild-test-")
+        url = "https://example.org/somerepo.git"
+        mirror = os.path.join(
+            tmpdir, hashlib.sha256(url.encode("utf-8")).hexdigest())
+
+        # cache hit => incremental fetch only
+        os.makedirs(os.path.join(mirror, "objects"))
+        self.assertEqual(mirror, update_git_cache(url, tmpdir))
+        run_cmd.assert_called_once_with(
+            ["git", "-C", mirror, "remote", "update", "--prune"])
+
+        # cache miss => full mirror clone
+        run_cmd.reset_mock()
+        shutil.rmtree(mirror)
+        run_cmd.side_effect = lambda cmd: os.makedirs(mirror)
+        self.assertEqual(mirror, update_git_cache(url, tmpdir))
+        run_cmd.assert_called_once_with(
+            ["git", "clone", "--mirror", url, mirror])
+        shutil.rmtree(tmpdir)